@@ -1,3 +1,4 @@
+import os
 import time
 import re
 import json
@@ -11,11 +12,21 @@ from bs4 import BeautifulSoup
 
 
 class ImprovedSeleniumCrawler:
-    def __init__(self, callback=None):
+    def __init__(self, callback=None, max_retries=3, backoff_base=2.0,
+                 checkpoint_file=None, checkpoint_every=10):
         self.callback = callback
         self.seed_file = Path(__file__).parent / "ics_authors.json"
         self.driver = None
 
+        # ---------- RETRY / CHECKPOINT SETTINGS ----------
+        if max_retries < 1:
+            raise ValueError("max_retries must be at least 1")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
+        self.checkpoint_every = checkpoint_every
+        self.state = None
+
     def log(self, msg):
         if self.callback:
             self.callback(msg)
@@ -28,7 +39,20 @@ class ImprovedSeleniumCrawler:
 
     def close_driver(self):
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except Exception:
+                pass  # driver may already be dead after a crash
+            self.driver = None
+
+    def recycle_driver(self):
+        self.log("    ↻ Restarting browser")
+        self.close_driver()
+        try:
+            self.init_driver()
+        except Exception as e:
+            # Leave driver unset; fetch_page starts it on the next attempt
+            self.log(f"    ✗ Browser restart failed ({type(e).__name__})")
 
     def load_author_seeds(self):
         if not self.seed_file.exists():
@@ -36,52 +60,174 @@ class ImprovedSeleniumCrawler:
         with open(self.seed_file, "r") as f:
             return json.load(f)
 
-    def crawl_department(self, base_url, max_authors):
-        self.init_driver()
-        publications = []
+    # --------------------------------------------------
+    # PAGE FETCH (RETRY + EXPONENTIAL BACKOFF)
+    # --------------------------------------------------
+    def fetch_page(self, url, wait):
+        error = None
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                if self.driver is None:
+                    self.init_driver()
+                self.driver.get(url)
+                time.sleep(wait)
+                return BeautifulSoup(self.driver.page_source, "html.parser")
+            except Exception as e:
+                error = e
+                self.log(
+                    f"    ! Attempt {attempt}/{self.max_retries} failed "
+                    f"({type(e).__name__})"
+                )
+                # Always restart, so the next URL gets a live browser too
+                self.recycle_driver()
+                if attempt < self.max_retries:
+                    delay = self.backoff_base ** attempt
+                    self.log(f"    … retrying in {delay:.0f}s")
+                    time.sleep(delay)
 
-        try:
+        raise error
+
+    # --------------------------------------------------
+    # CHECKPOINTING
+    # --------------------------------------------------
+    def new_state(self, base_url, max_authors, authors):
+        return {
+            "base_url": base_url,
+            "max_authors": max_authors,
+            "total": len(authors),
+            "frontier": list(authors),   # author profiles still to crawl
+            "pending": None,             # publication links of frontier[0]
+            "completed": [],             # fully crawled author profiles
+            "failed": [],                # profile/publication pages that gave up
+            "publications": [],
+        }
+
+    def load_checkpoint(self):
+        if not self.checkpoint_file or not self.checkpoint_file.exists():
+            return None
+        with open(self.checkpoint_file, "r") as f:
+            return json.load(f)
+
+    def save_checkpoint(self):
+        if not self.checkpoint_file or self.state is None:
+            return
+        self.state["updated_at"] = datetime.now().isoformat()
+        tmp = self.checkpoint_file.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.state, f, indent=2, default=str)
+        os.replace(tmp, self.checkpoint_file)  # atomic: never a half-written file
+
+    def clear_checkpoint(self):
+        if self.checkpoint_file and self.checkpoint_file.exists():
+            self.checkpoint_file.unlink()
+
+    # --------------------------------------------------
+    # CRAWL
+    # --------------------------------------------------
+    def crawl_department(self, base_url, max_authors, resume=False):
+        self.state = self.load_checkpoint() if resume else None
+
+        if self.state and (
+            self.state.get("base_url") != base_url
+            or self.state.get("max_authors") != max_authors
+        ):
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_file} was written for "
+                f"base_url={self.state.get('base_url')!r}, "
+                f"max_authors={self.state.get('max_authors')!r}; refusing to "
+                f"resume with base_url={base_url!r}, max_authors={max_authors!r}"
+            )
+
+        if self.state:
+            self.log(
+                f"Resuming crawl: {len(self.state['completed'])} authors done, "
+                f"{len(self.state['frontier'])} remaining, "
+                f"{len(self.state['publications'])} publications recovered"
+            )
+        else:
+            if resume:
+                self.log("No checkpoint found, starting a fresh crawl")
             authors = self.load_author_seeds()
             self.log(f"Loaded {len(authors)} ICS author profiles")
+            self.state = self.new_state(base_url, max_authors, authors[:max_authors])
 
-            for i, author_url in enumerate(authors[:max_authors], 1):
-                self.log(f"[{i}/{len(authors)}] Crawling author profile")
+        total = self.state["total"]
+        self.init_driver()
+        finished = False
+
+        try:
+            while self.state["frontier"]:
+                author_url = self.state["frontier"][0]
+                i = total - len(self.state["frontier"]) + 1
+                self.log(f"[{i}/{total}] Crawling author profile")
                 self.log(author_url)
 
-                pubs = self.crawl_author(author_url)
-                self.log(f"  → {len(pubs)} publications found")
-                publications.extend(pubs)
+                try:
+                    pubs = self.crawl_author(author_url)
+                    self.log(f"  → {len(pubs)} publications found")
+                    self.state["completed"].append(author_url)
+                except Exception as e:
+                    # A dead profile must not block the rest of the crawl
+                    self.log(f"  ✗ Failed author profile ({type(e).__name__}): {author_url}")
+                    self.state["failed"].append(author_url)
 
+                self.state["frontier"].pop(0)
+                self.state["pending"] = None
+                self.save_checkpoint()
+
+            publications = self.state["publications"]
             self.log(f"✓ Crawling finished. Total publications collected: {len(publications)}")
+
+            failed = self.state["failed"]
+            if failed:
+                self.log(f"  {len(failed)} pages could not be crawled:")
+                for url in failed:
+                    self.log(f"    - {url}")
+
+            finished = True
             return publications
 
         finally:
             self.close_driver()
+            # The checkpoint is kept even on success: the caller clears it
+            # once the results have been written out.
+            self.save_checkpoint()
+            if not finished and self.checkpoint_file:
+                self.log(f"✗ Crawl interrupted, progress saved to {self.checkpoint_file}")
 
     def crawl_author(self, profile_url):
-        self.driver.get(profile_url)
-        time.sleep(3)
+        if self.state["pending"] is None:
+            soup = self.fetch_page(profile_url, wait=3)
 
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            pub_links = set()
+            for a in soup.find_all("a", href=True):
+                if "/en/publications/" in a["href"]:
+                    pub_links.add(urljoin(profile_url, a["href"].split("?")[0]))
 
-        pub_links = set()
-        for a in soup.find_all("a", href=True):
-            if "/en/publications/" in a["href"]:
-                pub_links.add(urljoin(profile_url, a["href"].split("?")[0]))
+            self.state["pending"] = sorted(pub_links)
+            self.save_checkpoint()
 
         publications = []
-        for link in pub_links:
+        parsed = 0
+        while self.state["pending"]:
+            link = self.state["pending"][0]
             pub = self.parse_publication_page(link, profile_url)
             if pub:
                 publications.append(pub)
+                self.state["publications"].append(pub)
+            else:
+                self.state["failed"].append(link)
+            self.state["pending"].pop(0)
+
+            parsed += 1
+            if parsed % self.checkpoint_every == 0:
+                self.save_checkpoint()
 
         return publications
 
     def parse_publication_page(self, pub_url, profile_url):
         try:
-            self.driver.get(pub_url)
-            time.sleep(2)
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            soup = self.fetch_page(pub_url, wait=2)
 
             # ---------- TITLE ----------
             title_tag = soup.find("h1")
@@ -140,6 +286,6 @@ class ImprovedSeleniumCrawler:
                 "crawled_at": datetime.now().isoformat()
             }
 
-        except Exception:
-            self.log(f"    ✗ Failed publication page: {pub_url}")
+        except Exception as e:
+            self.log(f"    ✗ Failed publication page ({type(e).__name__}): {pub_url}")
             return None
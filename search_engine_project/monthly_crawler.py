@@ -4,14 +4,21 @@ Research Centre for Computational Science and Mathematical Modelling
 
 This script is intended to be executed automatically
 once per month using an OS scheduler (cron / Task Scheduler).
+
+Progress is checkpointed to data/crawl_checkpoint.json while crawling.
+If a run is interrupted, continue it with:
+
+    python monthly_crawler.py --resume
 """
 
+import argparse
 import json
 import os
+import pickle
 from datetime import datetime
 
 from core.crawler import ImprovedSeleniumCrawler
-from core.index1 import AdvancedInvertedIndex
+from core.index import AdvancedInvertedIndex
 
 # ---------------- CONFIG ----------------
 BASE_URL = (
@@ -25,6 +32,7 @@ DATA_DIR = "data"
 DATA_FILE = os.path.join(DATA_DIR, "publications.json")
 INDEX_FILE = os.path.join(DATA_DIR, "search_index.pkl")
 LOG_FILE = os.path.join(DATA_DIR, "crawl.log")
+CHECKPOINT_FILE = os.path.join(DATA_DIR, "crawl_checkpoint.json")
 
 os.makedirs(DATA_DIR, exist_ok=True)
 
@@ -37,11 +45,11 @@ def log(msg):
         f.write(full_msg + "\n")
 
 # ---------------- MAIN TASK ----------------
-def run_monthly_crawl():
-    log("=== MONTHLY CRAWL STARTED ===")
+def run_monthly_crawl(resume=False):
+    log("=== MONTHLY CRAWL RESUMED ===" if resume else "=== MONTHLY CRAWL STARTED ===")
 
-    crawler = ImprovedSeleniumCrawler(callback=log)
-    publications = crawler.crawl_department(BASE_URL, MAX_AUTHORS)
+    crawler = ImprovedSeleniumCrawler(callback=log, checkpoint_file=CHECKPOINT_FILE)
+    publications = crawler.crawl_department(BASE_URL, MAX_AUTHORS, resume=resume)
 
     log(f"Extracted {len(publications)} publications")
 
@@ -52,11 +60,25 @@ def run_monthly_crawl():
     for i, pub in enumerate(publications):
         index.add_document(i, pub)
 
-    index.save(INDEX_FILE)
+    index.build_tfidf_vectors()
+
+    with open(INDEX_FILE, "wb") as f:
+        pickle.dump(index, f)
+
+    # Results are safely on disk; the next run starts from scratch
+    crawler.clear_checkpoint()
 
     log("Index updated successfully")
     log("=== MONTHLY CRAWL COMPLETED ===\n")
 
 # ---------------- ENTRY POINT ----------------
 if __name__ == "__main__":
-    run_monthly_crawl()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue an interrupted crawl from its checkpoint"
+    )
+    args = parser.parse_args()
+
+    run_monthly_crawl(resume=args.resume)
\ No newline at end of file